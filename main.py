@@ -2,13 +2,18 @@
 # main.py
 import sys
 import os
+import io
 import json
+import hashlib
+import tempfile
 import typing
-import time
 import traceback
-import pygame
-from mutagen.mp3 import MP3
-from mutagen.id3 import ID3, APIC
+from collections import OrderedDict
+from functools import lru_cache
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from PyQt5 import QtCore, QtGui, QtWidgets
 
 # --------------------
@@ -31,6 +36,9 @@ SONGS_DIR = resource_path("songs")
 DATA_DIR  = resource_path("data")
 # logo placed in assets folder as you said
 LOGO_PATH = resource_path(os.path.join("assets", "logo.ico"))
+LOGO_EXISTS = os.path.exists(LOGO_PATH)
+# pre-rendered splash shipped with the build (optional)
+SPLASH_BAKED = resource_path(os.path.join("assets", "splash_baked.png"))
 # placeholder art (simple built-in color if no file)
 PLACEHOLDER_ART = resource_path(os.path.join("assets", "placeholder_art.png"))
 
@@ -38,9 +46,18 @@ IMPORTED_JSON = os.path.join(DATA_DIR, "imported_songs.json")
 CUSTOM_JSON   = os.path.join(DATA_DIR, "custom_playlist.json")
 RECENT_JSON   = os.path.join(DATA_DIR, "recent_songs.json")
 SEARCHES_JSON = os.path.join(DATA_DIR, "recent_searches.json")
+THUMBS_DIR    = os.path.join(DATA_DIR, "thumbs")
+# what the rendered splash depends on besides the logo file: title, size,
+# font and a version to bump whenever the painting in splash_pixmap() changes
+SPLASH_RENDER = (APP_TITLE, 480, 320, "Segoe UI", 18, 1)
+SPLASH_CACHE  = os.path.join(DATA_DIR, f"splash_cached_{hashlib.md5(repr(SPLASH_RENDER).encode('utf-8')).hexdigest()[:12]}.png")
 
 MAX_RECENTS = 5
 MAX_RECENT_SEARCHES = 8
+MAX_DURATION_CACHE = 4096
+SCANDIR_MIN_PATHS = 8  # existing_paths() stats directories with fewer paths than this instead of listing them
+_SS = tuple(f"{i:02d}" for i in range(60))  # zero-padded seconds for _format_time
+FAST_SCALE_MAX = 128  # art at or below this many device pixels (56px thumbs up to 2x DPR) is scaled with FastTransformation
 
 # --------------------
 # Utilities
@@ -50,6 +67,8 @@ def ensure_dirs():
         os.makedirs(DATA_DIR)
     if not os.path.exists(SONGS_DIR):
         os.makedirs(SONGS_DIR)
+    if not os.path.exists(THUMBS_DIR):
+        os.makedirs(THUMBS_DIR)
     # make sure assets folder exists for packaging (optional)
     assets_dir = resource_path("assets")
     if not os.path.exists(assets_dir):
@@ -61,6 +80,9 @@ def ensure_dirs():
 def load_json(path, default):
     try:
         if os.path.exists(path):
+            if orjson is not None:
+                with open(path, "rb") as f:
+                    return orjson.loads(f.read())
             with open(path, "r", encoding="utf-8") as f:
                 return json.load(f)
     except Exception:
@@ -69,44 +91,377 @@ def load_json(path, default):
 
 def save_json(path, data):
     try:
+        if orjson is not None:
+            with open(path, "wb") as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            return
         with open(path, "w", encoding="utf-8") as f:
             json.dump(data, f, indent=2, ensure_ascii=False)
     except Exception as e:
         print("Save error:", e)
 
+@lru_cache(maxsize=8192)
 def nice_title(path):
     base = os.path.basename(path)
     name = os.path.splitext(base)[0]
     return name.replace("_", " ").replace("-", " ")
 
+@lru_cache(maxsize=None)
+def _get_mutagen():
+    # imported on first use so it stays off the splash/startup path
+    import mutagen
+    import mutagen.id3
+    import mutagen.mp3
+    return mutagen
+
+@lru_cache(maxsize=None)
+def _get_pil_image():
+    # optional; Pillow wheels bundle libjpeg-turbo, which decodes JPEG art
+    # faster than Qt's plugin. Imported on first decode, None if not installed.
+    try:
+        from PIL import Image
+    except ImportError:
+        return None
+    return Image
+
+@lru_cache(maxsize=None)
+def _get_qtmultimedia():
+    # playback backend, imported when the first track is played
+    from PyQt5 import QtMultimedia
+    return QtMultimedia
+
 def is_file(path):
     return os.path.isfile(path)
 
+def existing_paths(paths) -> typing.Set[str]:
+    """
+    Subset of paths that exist as files, using one scandir per distinct
+    directory instead of one stat per path; directories holding only a few
+    of the paths are cheaper to stat directly. A scandir name match is only a
+    fast positive: anything it misses (case-insensitive filesystems, Unicode
+    normalization differences, unreadable dirs) is confirmed with is_file().
+    """
+    by_dir: typing.Dict[str, typing.List[str]] = {}
+    for p in paths:
+        by_dir.setdefault(os.path.dirname(p), []).append(p)
+    out = set()
+    for d, ps in by_dir.items():
+        if len(ps) < SCANDIR_MIN_PATHS:
+            out.update(p for p in ps if is_file(p))
+            continue
+        try:
+            with os.scandir(d or ".") as it:
+                names = {e.name for e in it if e.is_file()}
+        except OSError:
+            names = set()
+        out.update(p for p in ps if os.path.basename(p) in names or is_file(p))
+    return out
+
+# MPEG audio Layer III header tables (kbps / Hz), indexed by header bits
+_MP3_BITRATES = {
+    3: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),  # MPEG1
+    2: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),      # MPEG2
+    0: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),      # MPEG2.5
+}
+_MP3_SAMPLE_RATES = {3: (44100, 48000, 32000), 2: (22050, 24000, 16000), 0: (11025, 12000, 8000)}
+
+def _parse_mp3_frame_header(buf, i):
+    # returns (version, bitrate_kbps, sample_rate, frame_len, mono) or None
+    if buf[i] != 0xFF or (buf[i + 1] & 0xE0) != 0xE0:
+        return None
+    version = (buf[i + 1] >> 3) & 3
+    layer = (buf[i + 1] >> 1) & 3
+    br_idx = buf[i + 2] >> 4
+    sr_idx = (buf[i + 2] >> 2) & 3
+    if version == 1 or layer != 1 or br_idx in (0, 15) or sr_idx == 3:
+        return None
+    bitrate = _MP3_BITRATES[version][br_idx]
+    sample_rate = _MP3_SAMPLE_RATES[version][sr_idx]
+    padding = (buf[i + 2] >> 1) & 1
+    coef = 144 if version == 3 else 72
+    frame_len = coef * bitrate * 1000 // sample_rate + padding
+    mono = (buf[i + 3] >> 6) == 3
+    return version, bitrate, sample_rate, frame_len, mono
+
+def mp3_header_duration(path) -> typing.Optional[float]:
+    """
+    Duration from the first MPEG frame only: Xing/Info or VBRI frame count
+    when present, else size / bitrate (CBR). None if no frame header is found.
+    """
+    with open(path, "rb") as f:
+        head = f.read(10)
+        start = 0
+        if len(head) == 10 and head[:3] == b"ID3":
+            start = 10 + ((head[6] << 21) | (head[7] << 14) | (head[8] << 7) | head[9])
+            if head[5] & 0x10:  # footer present
+                start += 10
+        f.seek(start)
+        buf = f.read(16384)
+        f.seek(0, os.SEEK_END)
+        file_size = f.tell()
+        if file_size >= 128:
+            f.seek(file_size - 128)
+            if f.read(3) == b"TAG":
+                file_size -= 128
+    for i in range(len(buf) - 4):
+        hdr = _parse_mp3_frame_header(buf, i)
+        if hdr is None:
+            continue
+        version, bitrate, sample_rate, frame_len, mono = hdr
+        # require a second frame right after the first to rule out false syncs
+        nxt = i + frame_len
+        if nxt + 4 <= len(buf) and _parse_mp3_frame_header(buf, nxt) is None:
+            continue
+        samples = 1152 if version == 3 else 576
+        side = (17 if mono else 32) if version == 3 else (9 if mono else 17)
+        x = i + 4 + side
+        if buf[x:x + 4] in (b"Xing", b"Info") and buf[x + 7] & 1:
+            frames = int.from_bytes(buf[x + 8:x + 12], "big")
+            if frames:
+                return frames * samples / sample_rate
+        v = i + 36
+        if buf[v:v + 4] == b"VBRI":
+            frames = int.from_bytes(buf[v + 14:v + 18], "big")
+            if frames:
+                return frames * samples / sample_rate
+        audio_bytes = file_size - (start + i)
+        return audio_bytes * 8 / (bitrate * 1000)
+    return None
+
+# duration cache: (path, mtime_ns, size) -> seconds
+_DURATION_CACHE: "OrderedDict[tuple, float]" = OrderedDict()
+
 def get_duration(path):
     try:
-        audio = MP3(path)
-        return float(audio.info.length)
+        st = os.stat(path)
+        key = (path, st.st_mtime_ns, st.st_size)
+        v = _DURATION_CACHE.get(key)
+        if v is not None:
+            _DURATION_CACHE.move_to_end(key)
+            return v
+        try:
+            v = mp3_header_duration(path)
+        except (OSError, IndexError):
+            v = None
+        if v is None:
+            v = float(_get_mutagen().mp3.MP3(path).info.length)
+        _DURATION_CACHE[key] = v
+        if len(_DURATION_CACHE) > MAX_DURATION_CACHE:
+            _DURATION_CACHE.popitem(last=False)
+        return v
     except Exception:
         return 0.0
 
-def extract_album_art_pixmap(path) -> typing.Optional[QtGui.QPixmap]:
+def forget_duration(path):
+    for key in [k for k in _DURATION_CACHE if k[0] == path]:
+        del _DURATION_CACHE[key]
+
+def decode_image(data, target=None) -> typing.Optional[QtGui.QImage]:
+    """
+    Decode encoded image bytes to a QImage. JPEGs go through Pillow when it
+    is installed; everything else (or any Pillow failure) uses Qt.
+    With target, JPEGs are downscaled during decode (libjpeg DCT scaling)
+    to the smallest 1/2, 1/4 or 1/8 size still >= target x target.
+    """
+    Image = _get_pil_image() if data[:2] == b"\xff\xd8" else None
+    if Image is not None:
+        try:
+            im = Image.open(io.BytesIO(data))
+            if target:
+                im.draft("RGB", (target, target))
+            im = im.convert("RGB")
+            raw = im.tobytes("raw", "RGB")
+            # copy() detaches the QImage from the temporary bytes buffer
+            return QtGui.QImage(raw, im.width, im.height, im.width * 3, QtGui.QImage.Format_RGB888).copy()
+        except Exception:
+            pass
+    img = QtGui.QImage()
+    if img.loadFromData(data):
+        return img
+    return None
+
+def extract_album_art_image(path, target=None) -> typing.Optional[QtGui.QImage]:
     """
     Try to extract embedded album art from an MP3 ID3 APIC frame.
-    Returns QPixmap or None.
+    target is a decode size hint (see decode_image).
+    Returns QImage or None. Safe to call from a worker thread.
     """
+    mutagen = _get_mutagen()
     try:
-        tags = ID3(path)
-        for frame in tags.values():
-            if isinstance(frame, APIC):
-                data = frame.data
-                pix = QtGui.QPixmap()
-                if pix.loadFromData(data):
-                    return pix
-    except Exception:
+        # only the APIC frame is needed: skip v2.3 translation and the v1 tag
+        tags = mutagen.id3.ID3(path, translate=False, load_v1=False)
+        for frame in tags.getall("APIC"):
+            img = decode_image(frame.data, target)
+            if img is not None:
+                return img
+    except mutagen.id3.ID3NoHeaderError:
+        return None
+    except mutagen.MutagenError:
         pass
     # no art
     return None
 
+# logo scaled once per size (full .ico decode happens only on first use)
+_LOGO_PIXMAPS: typing.Dict[int, QtGui.QPixmap] = {}
+
+def logo_pixmap(size) -> QtGui.QPixmap:
+    pix = _LOGO_PIXMAPS.get(size)
+    if pix is None:
+        pix = QtGui.QPixmap(LOGO_PATH).scaled(size, size, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
+        _LOGO_PIXMAPS[size] = pix
+    return pix
+
+def thumb_key(path, size):
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return None
+    return hashlib.md5(f"{path}|{mtime}|{size}".encode("utf-8")).hexdigest()
+
+def save_thumb(img, cache_file):
+    # write a private temp file and rename it into place: another thread may be
+    # loading the same cache key and must never see a half-written PNG
+    try:
+        fd, tmp = tempfile.mkstemp(suffix=".tmp", dir=THUMBS_DIR)
+        os.close(fd)
+        if img.save(tmp, "PNG"):
+            os.replace(tmp, cache_file)
+        else:
+            os.remove(tmp)
+    except OSError:
+        pass
+
+# thumb keys of tracks known to have no embedded art (keys change with mtime)
+_NO_ART_KEYS: typing.Set[str] = set()
+
+def load_thumb_images(path, sizes) -> typing.Dict[str, QtGui.QImage]:
+    """
+    Album art for several sizes at once; sizes maps cache key -> size.
+    Each is read from / written to the on-disk cache in THUMBS_DIR. The tag
+    is parsed and the art decoded at most once, at the largest missing size,
+    then scaled for the others. Returns {key: QImage}, empty if the track has
+    no art. Safe to call from a worker thread.
+    """
+    out: typing.Dict[str, QtGui.QImage] = {}
+    missing: typing.Dict[str, int] = {}
+    for key, size in sizes.items():
+        img = QtGui.QImage()
+        if img.load(os.path.join(THUMBS_DIR, key + ".png")):
+            out[key] = img
+        else:
+            missing[key] = size
+    if not missing or not _NO_ART_KEYS.isdisjoint(missing):
+        return out
+    art = extract_album_art_image(path, max(missing.values()))
+    if art is None:
+        _NO_ART_KEYS.update(sizes)
+        return out
+    for key, size in missing.items():
+        if max(art.width(), art.height()) == size:
+            img = art
+        else:
+            # smooth filtering only pays off for the large full-player art
+            mode = QtCore.Qt.SmoothTransformation if size > FAST_SCALE_MAX else QtCore.Qt.FastTransformation
+            img = art.scaled(size, size, QtCore.Qt.KeepAspectRatio, mode)
+        save_thumb(img, os.path.join(THUMBS_DIR, key + ".png"))
+        out[key] = img
+    return out
+
+def load_thumb_image(path, key, size=56) -> typing.Optional[QtGui.QImage]:
+    """
+    Album art scaled to size x size (see load_thumb_images). Returns QImage or None.
+    """
+    return load_thumb_images(path, {key: size}).get(key)
+
+def cached_thumb_pixmap(key) -> typing.Optional[QtGui.QPixmap]:
+    pix = QtGui.QPixmapCache.find(key)
+    if pix is not None and not pix.isNull():
+        return pix
+    return None
+
+def art_pixels(size, dpr):
+    # device pixels needed to show size logical pixels at dpr
+    return max(1, int(round(size * dpr)))
+
+def load_art_cached(path, size, dpr=1.0) -> typing.Optional[QtGui.QPixmap]:
+    """
+    Synchronous (GUI thread) album art at size x size logical pixels, going
+    through the QPixmapCache and the on-disk thumbnail cache. Rendered at
+    device resolution for dpr. Returns QPixmap or None.
+    """
+    px = art_pixels(size, dpr)
+    key = thumb_key(path, px)
+    if key is None:
+        return None
+    pix = cached_thumb_pixmap(key)
+    if pix:
+        return pix
+    img = load_thumb_image(path, key, px)
+    if img is None:
+        return None
+    pix = QtGui.QPixmap.fromImage(img)
+    pix.setDevicePixelRatio(dpr)
+    QtGui.QPixmapCache.insert(key, pix)
+    return pix
+
+# --------------------
+# Album art loader (worker thread)
+# --------------------
+class ArtLoaderSignals(QtCore.QObject):
+    loaded = QtCore.pyqtSignal(int, str, int, QtGui.QImage)  # request id, cache key, size, image
+
+class ArtLoader(QtCore.QRunnable):
+    def __init__(self, req_id, path, sizes):
+        super().__init__()
+        self.req_id = req_id
+        self.path = path
+        # logical size (reported back in the signal) -> (cache key, device pixels rendered)
+        self.sizes: typing.Dict[int, typing.Tuple[str, int]] = sizes
+        self.signals = ArtLoaderSignals()
+
+    def run(self):
+        try:
+            imgs = load_thumb_images(self.path, dict(self.sizes.values()))
+        except Exception:
+            imgs = {}
+        for size, (key, _px) in self.sizes.items():
+            img = imgs.get(key)
+            self.signals.loaded.emit(self.req_id, key, size, img if img is not None else QtGui.QImage())
+
+# --------------------
+# Song list model
+# --------------------
+class SongListModel(QtCore.QAbstractListModel):
+    """
+    Read-only list model over MainWindow.master_songs dicts.
+    DisplayRole -> title, UserRole -> path, TitleLowerRole -> title_lower.
+    """
+    TitleLowerRole = QtCore.Qt.UserRole + 1
+
+    def __init__(self, songs=None, parent=None):
+        super().__init__(parent)
+        self._songs: typing.List[dict] = songs if songs is not None else []
+
+    def set_songs(self, songs: typing.List[dict]):
+        self.beginResetModel()
+        self._songs = songs
+        self.endResetModel()
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self._songs)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid() or not (0 <= index.row() < len(self._songs)):
+            return None
+        s = self._songs[index.row()]
+        if role == QtCore.Qt.DisplayRole:
+            return s["title"]
+        if role == QtCore.Qt.UserRole:
+            return s["path"]
+        if role == self.TitleLowerRole:
+            return s["title_lower"]
+        return None
+
 # --------------------
 # Music backend
 # --------------------
@@ -117,72 +472,73 @@ class MusicPlayer(QtCore.QObject):
 
     def __init__(self):
         super().__init__()
-        # init pygame mixer
-        try:
-            pygame.mixer.init()
-        except Exception as e:
-            print("pygame mixer init error:", e)
+        # QMediaPlayer is created lazily on first playback (see _ensure_player)
+        self._qplayer = None
         self.playlist: typing.List[str] = []
+        self._playlist_index: typing.Dict[str, int] = {}
         self.current_index: int = -1
         self.playing: bool = False
         self.volume = 0.85
-        try:
-            pygame.mixer.music.set_volume(self.volume)
-        except Exception:
-            pass
-
-        # tracking for position
-        self._track_start_time = None
-        self._track_offset_seconds = 0.0
-
-        self._timer = QtCore.QTimer()
-        self._timer.setInterval(300)
-        self._timer.timeout.connect(self._tick)
-        self._timer.start()
-
-    def _tick(self):
-        cur = 0.0
-        total = 0.0
-        path = None
-        if self.current_index != -1 and 0 <= self.current_index < len(self.playlist):
-            path = self.playlist[self.current_index]
-            total = get_duration(path)
-        if self.playing and self._track_start_time is not None:
-            try:
-                ms = pygame.mixer.music.get_pos()
-                if ms >= 0:
-                    cur = self._track_offset_seconds + (ms / 1000.0)
-                else:
-                    cur = self._track_offset_seconds + (time.time() - self._track_start_time)
-            except Exception:
-                cur = self._track_offset_seconds + (time.time() - self._track_start_time)
-        else:
-            cur = self._track_offset_seconds
 
-        if cur is None: cur = 0.0
-        if total is None: total = 0.0
+        # tracking for position (both reported by the backend)
+        self._loaded_path = None
+        self._position = 0.0
+        self._current_total = 0.0
+        self._pending_seek_ms = None
 
-        # emit
+    def _ensure_player(self):
+        if self._qplayer is not None:
+            return True
         try:
-            self.position_updated.emit(float(cur), float(total))
-        except Exception:
-            pass
+            QtMultimedia = _get_qtmultimedia()
+        except Exception as e:
+            # e.g. missing system audio libraries; report and keep the UI alive
+            print("QtMultimedia init error:", e)
+            return False
+        self._qplayer = QtMultimedia.QMediaPlayer(self)
+        self._qplayer.setNotifyInterval(500)
+        self._qplayer.setVolume(int(self.volume * 100))
+        self._qplayer.durationChanged.connect(self._on_duration_changed)
+        self._qplayer.positionChanged.connect(self._on_position_changed)
+        self._qplayer.mediaStatusChanged.connect(self._on_media_status)
+        return True
+
+    def _on_duration_changed(self, ms):
+        self._current_total = ms / 1000.0 if ms > 0 else 0.0
+        self.position_updated.emit(self._position, self._current_total)
+
+    def _on_position_changed(self, ms):
+        self._position = ms / 1000.0
+        self.position_updated.emit(self._position, self._current_total)
+
+    def _on_media_status(self, status):
+        QtMultimedia = _get_qtmultimedia()
+        if status in (QtMultimedia.QMediaPlayer.LoadedMedia, QtMultimedia.QMediaPlayer.BufferedMedia):
+            # some backends ignore setPosition until the media is loaded
+            if self._pending_seek_ms is not None:
+                self._qplayer.setPosition(self._pending_seek_ms)
+                self._pending_seek_ms = None
+        elif status == QtMultimedia.QMediaPlayer.EndOfMedia:
+            self.playing = False
+            self.state_changed.emit()
+            self.next()
+        elif status == QtMultimedia.QMediaPlayer.InvalidMedia:
+            print("Playback error:", self._qplayer.errorString())
+            self.playing = False
+            self.state_changed.emit()
 
-        # auto next on end
-        if self.playing and not pygame.mixer.music.get_busy():
-            if total > 1 and cur >= total - 0.7:
-                self.playing = False
-                self.state_changed.emit()
-                self.next()
-            elif total <= 1:
-                self.playing = False
-                self.state_changed.emit()
-                self.next()
-
-    def load_playlist(self, paths: typing.List[str]):
-        self.playlist = [p for p in paths if is_file(p)]
+    def load_playlist(self, paths: typing.List[str], skip_validate=False):
+        # skip_validate: paths were already checked (e.g. built from master_songs)
+        self.playlist = list(paths) if skip_validate else [p for p in paths if is_file(p)]
+        self._playlist_index: typing.Dict[str, int] = {p: i for i, p in enumerate(self.playlist)}
         self.current_index = 0 if self.playlist else -1
 
+    def has_track(self, path):
+        return path in self._playlist_index
+
+    def duration(self):
+        return self._current_total
+
     def current_track(self):
         if self.current_index == -1:
             return None
@@ -191,18 +547,15 @@ class MusicPlayer(QtCore.QObject):
         return None
 
     def _play_internal(self, path, start_time=0.0):
+        if not self._ensure_player():
+            return
         try:
-            pygame.mixer.music.load(path)
-            try:
-                pygame.mixer.music.play(loops=0, start=start_time)
-            except TypeError:
-                pygame.mixer.music.play()
-                try:
-                    pygame.mixer.music.set_pos(start_time)
-                except Exception:
-                    pass
-            self._track_offset_seconds = start_time
-            self._track_start_time = time.time()
+            self._qplayer.setMedia(_get_qtmultimedia().QMediaContent(QtCore.QUrl.fromLocalFile(path)))
+            self._loaded_path = path
+            self._position = start_time
+            self._current_total = 0.0
+            self._pending_seek_ms = int(start_time * 1000) if start_time > 0 else None
+            self._qplayer.play()
             self.playing = True
             self.track_changed.emit(path)
             self.state_changed.emit()
@@ -220,49 +573,34 @@ class MusicPlayer(QtCore.QObject):
 
     def play_path(self, path: str):
         if not is_file(path): return
-        if path in self.playlist:
-            self.play_index(self.playlist.index(path))
+        idx = self._playlist_index.get(path)
+        if idx is not None:
+            self.play_index(idx)
         else:
             self.current_index = -1
             self._play_internal(path, start_time=0.0)
 
     def toggle(self):
         if self.playing:
-            try:
-                pygame.mixer.music.pause()
-            except Exception:
-                pass
-            try:
-                ms = pygame.mixer.music.get_pos()
-                if ms >= 0:
-                    self._track_offset_seconds += (ms / 1000.0)
-                else:
-                    self._track_offset_seconds += (time.time() - self._track_start_time)
-            except Exception:
-                self._track_offset_seconds += (time.time() - (self._track_start_time or time.time()))
+            self._qplayer.pause()
             self.playing = False
             self.state_changed.emit()
-        else:
-            try:
-                pygame.mixer.music.unpause()
-                self.playing = True
-                self._track_start_time = time.time()
-                self.state_changed.emit()
-            except Exception:
-                if self.playlist:
-                    if self.current_index == -1:
-                        self.play_index(0)
-                    else:
-                        self._play_internal(self.playlist[self.current_index], start_time=self._track_offset_seconds)
+        elif self._qplayer is not None and self._qplayer.state() == _get_qtmultimedia().QMediaPlayer.PausedState:
+            self._qplayer.play()
+            self.playing = True
+            self.state_changed.emit()
+        elif self.playlist:
+            if self.current_index == -1:
+                self.play_index(0)
+            else:
+                self._play_internal(self.playlist[self.current_index], start_time=self._position)
 
     def stop(self):
-        try:
-            pygame.mixer.music.stop()
-        except Exception:
-            pass
+        if self._qplayer is not None:
+            self._qplayer.stop()
         self.playing = False
-        self._track_start_time = None
-        self._track_offset_seconds = 0.0
+        self._position = 0.0
+        self.position_updated.emit(0.0, self._current_total)
         self.state_changed.emit()
 
     def next(self):
@@ -277,10 +615,8 @@ class MusicPlayer(QtCore.QObject):
 
     def set_volume(self, vol: float):
         self.volume = max(0.0, min(1.0, vol))
-        try:
-            pygame.mixer.music.set_volume(self.volume)
-        except Exception:
-            pass
+        if self._qplayer is not None:
+            self._qplayer.setVolume(int(self.volume * 100))
         self.state_changed.emit()
 
     def seek(self, seconds: float):
@@ -288,25 +624,17 @@ class MusicPlayer(QtCore.QObject):
             return
         path = self.playlist[self.current_index]
         if not is_file(path): return
-        total = get_duration(path)
+        total = self._current_total
         seconds = max(0.0, min(seconds, total if total > 0 else seconds))
-        try:
-            pygame.mixer.music.load(path)
-            try:
-                pygame.mixer.music.play(loops=0, start=seconds)
-            except TypeError:
-                pygame.mixer.music.play()
-                try:
-                    pygame.mixer.music.set_pos(seconds)
-                except Exception:
-                    pass
-            self._track_offset_seconds = seconds
-            self._track_start_time = time.time()
+        if path != self._loaded_path:
+            self._play_internal(path, start_time=seconds)
+            return
+        # same media: seek in place, no reload
+        self._qplayer.setPosition(int(seconds * 1000))
+        if not self.playing:
+            self._qplayer.play()
             self.playing = True
-            self.track_changed.emit(path)
             self.state_changed.emit()
-        except Exception as e:
-            print("Seek error:", e)
 
 # --------------------
 # MainWindow UI
@@ -314,9 +642,9 @@ class MusicPlayer(QtCore.QObject):
 class MainWindow(QtWidgets.QMainWindow):
     def __init__(self):
         super().__init__()
-        ensure_dirs()
+        # data/songs dirs are created by main() on a worker thread (see _Task)
         self.setWindowTitle(APP_TITLE)
-        if os.path.exists(LOGO_PATH):
+        if LOGO_EXISTS:
             try:
                 self.setWindowIcon(QtGui.QIcon(LOGO_PATH))
             except Exception:
@@ -325,19 +653,41 @@ class MainWindow(QtWidgets.QMainWindow):
 
         # Styling
         self.setStyleSheet(self._qss())
-
-        # Data
+        QtGui.QPixmapCache.setCacheLimit(64 * 1024)
+        # bumped on every track change so late art results are dropped
+        self._art_req_id = 0
+        # art for the current track by size (56 mini thumb, 320 full player)
+        self._current_art_path = None
+        self._current_art_pix: typing.Dict[int, QtGui.QPixmap] = {}
+        self._full_player_dlg = None
+
+        # Data (writes are batched through _queue_save / _flush_json)
+        self._dirty_files: typing.Dict[str, typing.Any] = {}
+        self._flush_timer = QtCore.QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(1000)
+        self._flush_timer.timeout.connect(self._flush_json)
         self.imported = load_json(IMPORTED_JSON, [])
         self.custom   = load_json(CUSTOM_JSON, [])
         self.recents  = load_json(RECENT_JSON, [])
         self.searches = load_json(SEARCHES_JSON, [])
+        # parallel sets for O(1) membership; the lists keep the order
+        self._imported_set = set(self.imported)
+        self._custom_set   = set(self.custom)
+        self._recents_set  = set(self.recents)
+        self._searches_set = set(self.searches)
 
         self.master_songs: typing.List[dict] = []
+        # bundled songs scan, reused until SONGS_DIR's mtime changes
+        self._songs_dir_mtime = -1
+        self._bundled_cache: typing.List[dict] = []
+        # set when imports/removals change the library; cleared by _refresh_master
+        self._master_dirty = True
         self._refresh_master()
 
         # Player
         self.player = MusicPlayer()
-        self.player.load_playlist([s['path'] for s in self.master_songs])
+        self.player.load_playlist([s['path'] for s in self.master_songs], skip_validate=True)
         self.player.track_changed.connect(self._on_track_changed)
         self.player.position_updated.connect(self._on_position_update)
         self.player.state_changed.connect(self._on_state_changed)
@@ -372,15 +722,13 @@ class MainWindow(QtWidgets.QMainWindow):
 
         # header with logo and title
         header = QtWidgets.QHBoxLayout()
-        if os.path.exists(LOGO_PATH):
+        if LOGO_EXISTS:
             logo_lbl = QtWidgets.QLabel()
-            pix = QtGui.QPixmap(LOGO_PATH)
-            logo_lbl.setPixmap(pix.scaled(56, 56, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation))
+            logo_lbl.setPixmap(logo_pixmap(56))
             logo_lbl.setFixedSize(64, 64)
             header.addWidget(logo_lbl)
         title = QtWidgets.QLabel(APP_TITLE)
         title.setObjectName("Title")
-        title.setStyleSheet("font-weight:800; font-size:20px; margin-left:8px; color:#2a014b;")
         header.addWidget(title)
         header.addStretch()
         v.addLayout(header)
@@ -403,8 +751,11 @@ class MainWindow(QtWidgets.QMainWindow):
 
         # all songs
         v.addWidget(self._section_label("All Songs"))
-        self.home_list = QtWidgets.QListWidget()
-        self.home_list.itemDoubleClicked.connect(self._play_from_home)
+        self.song_model = SongListModel(self.master_songs, self)
+        self.home_list = QtWidgets.QListView()
+        self.home_list.setModel(self.song_model)
+        self.home_list.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.home_list.doubleClicked.connect(self._play_from_home)
         self.home_list.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
         self.home_list.customContextMenuRequested.connect(self._home_menu)
         v.addWidget(self.home_list)
@@ -437,7 +788,13 @@ class MainWindow(QtWidgets.QMainWindow):
         v = QtWidgets.QVBoxLayout(page)
         self.search_inp = QtWidgets.QLineEdit()
         self.search_inp.setPlaceholderText("Search songs…")
-        self.search_inp.textChanged.connect(self._on_search_change)
+        # coalesce keystrokes: search runs 150ms after typing stops
+        self._search_timer = QtCore.QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self._do_search)
+        self.search_inp.textChanged.connect(lambda _=None: self._search_timer.start())
+        self.search_inp.returnPressed.connect(self._on_search_submit)
         v.addWidget(self.search_inp)
         v.addWidget(QtWidgets.QLabel("Recent searches"))
         self.search_recent = QtWidgets.QListWidget()
@@ -445,16 +802,27 @@ class MainWindow(QtWidgets.QMainWindow):
         self.search_recent.itemClicked.connect(self._search_recent_clicked)
         v.addWidget(self.search_recent)
         v.addWidget(QtWidgets.QLabel("Results"))
-        self.search_results = QtWidgets.QListWidget()
-        self.search_results.itemDoubleClicked.connect(self._play_from_search)
+        # results filter the shared song model on title_lower (case folded up front)
+        self.search_proxy = QtCore.QSortFilterProxyModel(self)
+        self.search_proxy.setSourceModel(self.song_model)
+        self.search_proxy.setFilterRole(SongListModel.TitleLowerRole)
+        self.search_proxy.setFilterCaseSensitivity(QtCore.Qt.CaseSensitive)
+        self.search_results = QtWidgets.QListView()
+        self.search_results.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.search_results.setModel(self.search_proxy)
+        self.search_results.hide()
+        self.search_results.doubleClicked.connect(self._play_from_search)
         self.search_results.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
         self.search_results.customContextMenuRequested.connect(self._search_menu)
         v.addWidget(self.search_results)
+        self.search_empty = QtWidgets.QLabel("No songs found.")
+        self.search_empty.hide()
+        v.addWidget(self.search_empty)
         return page
 
     def _section_label(self, text):
         lbl = QtWidgets.QLabel(text)
-        lbl.setStyleSheet("color:#5b2b88; font-weight:700; margin-top:6px;")
+        lbl.setObjectName("SectionLabel")
         return lbl
 
     def _playlist_card(self, title, subtitle, cb):
@@ -463,12 +831,11 @@ class MainWindow(QtWidgets.QMainWindow):
         lay = QtWidgets.QVBoxLayout(card)
         t = QtWidgets.QLabel(f"<b>{title}</b>")
         s = QtWidgets.QLabel(subtitle)
-        s.setStyleSheet("color:#666;")
+        s.setObjectName("CardSubtitle")
         btn = QtWidgets.QPushButton("Open")
         btn.clicked.connect(cb)
         lay.addWidget(t); lay.addWidget(s); lay.addStretch(); lay.addWidget(btn)
         card.setFixedSize(240, 120)
-        card.setStyleSheet("QFrame#Card { background: #fff; border-radius:10px; padding:10px; border:1px solid #eee; }")
         return card
 
     # --------------------
@@ -488,14 +855,14 @@ class MainWindow(QtWidgets.QMainWindow):
         # album art small
         self.art_thumb = QtWidgets.QLabel()
         self.art_thumb.setFixedSize(56,56)
-        self.art_thumb.setStyleSheet("border-radius:6px; background:#eee;")
+        self.art_thumb.setObjectName("ArtThumb")
         self.art_thumb.setAlignment(QtCore.Qt.AlignCenter)
         player_layout.addWidget(self.art_thumb)
 
         # song title and timeline
         col = QtWidgets.QVBoxLayout()
         self.mini_label = QtWidgets.QLabel("Nothing playing")
-        self.mini_label.setStyleSheet("font-weight:700; color:#2a014b;")
+        self.mini_label.setObjectName("MiniTitle")
         self.mini_label.mousePressEvent = self._open_full_player
         col.addWidget(self.mini_label)
 
@@ -509,6 +876,10 @@ class MainWindow(QtWidgets.QMainWindow):
         times_row = QtWidgets.QHBoxLayout()
         self.label_elapsed = QtWidgets.QLabel("0:00")
         self.label_total = QtWidgets.QLabel("0:00")
+        # last values written, so position ticks only touch widgets that change
+        self._last_elapsed_str = "0:00"
+        self._last_total_str = "0:00"
+        self._last_slider_pos = 0
         times_row.addWidget(self.label_elapsed)
         times_row.addStretch()
         times_row.addWidget(self.label_total)
@@ -538,6 +909,12 @@ class MainWindow(QtWidgets.QMainWindow):
         self.vol_slider.setValue(int(self.player.volume*100))
         self.vol_slider.setFixedWidth(120)
         self.vol_slider.valueChanged.connect(self._vol_changed)
+        # slider drags are coalesced before reaching the backend
+        self._pending_vol = self.player.volume
+        self._vol_timer = QtCore.QTimer(self)
+        self._vol_timer.setSingleShot(True)
+        self._vol_timer.setInterval(15)
+        self._vol_timer.timeout.connect(self._commit_vol)
         vol_box.addWidget(self.vol_icon)
         vol_box.addWidget(self.vol_slider)
         player_layout.addLayout(vol_box)
@@ -564,43 +941,81 @@ class MainWindow(QtWidgets.QMainWindow):
         dock.setWidget(container)
         self.addDockWidget(QtCore.Qt.BottomDockWidgetArea, dock)
 
-        # timeline state
+        # timeline state (drag label updates are coalesced by _seek_timer)
         self._seeking = False
         self._seek_target = 0.0
+        self._seek_total = 0.0
+        self._seek_target_value = 0
+        self._seek_timer = QtCore.QTimer(self)
+        self._seek_timer.setSingleShot(True)
+        self._seek_timer.setInterval(50)
+        self._seek_timer.timeout.connect(self._apply_pending_seek_label)
 
     # --------------------
     # Navigation / refresh
     # --------------------
     def _goto(self, idx):
         if idx == 0:
+            self._refresh_library()
+        self.stack.setCurrentIndex(idx)
+
+    def _songs_dir_changed(self):
+        try:
+            return os.stat(SONGS_DIR).st_mtime_ns != self._songs_dir_mtime
+        except OSError:
+            return self._songs_dir_mtime != -1
+
+    def _refresh_library(self):
+        # no-op unless the library was touched or the songs dir changed on disk
+        if self._master_dirty or self._songs_dir_changed():
             self._refresh_master()
             self._refresh_home_lists()
-        self.stack.setCurrentIndex(idx)
+
+    def _song_record(self, path, source):
+        title = nice_title(path)
+        return {"title": title, "title_lower": title.lower(), "path": path, "source": source}
+
+    def _scan_songs_dir(self):
+        try:
+            st = os.stat(SONGS_DIR)
+        except OSError:
+            self._songs_dir_mtime = -1
+            self._bundled_cache = []
+            return []
+        if st.st_mtime_ns == self._songs_dir_mtime:
+            return self._bundled_cache
+        with os.scandir(SONGS_DIR) as it:
+            entries = [e for e in it if e.is_file() and e.name.lower().endswith(".mp3")]
+        entries.sort(key=lambda e: e.name)
+        self._bundled_cache = [self._song_record(e.path, "bundled") for e in entries]
+        self._songs_dir_mtime = st.st_mtime_ns
+        return self._bundled_cache
 
     def _refresh_master(self):
-        songs = []
-        if os.path.exists(SONGS_DIR):
-            for f in sorted(os.listdir(SONGS_DIR)):
-                if f.lower().endswith(".mp3"):
-                    p = os.path.join(SONGS_DIR, f)
-                    songs.append({"title": nice_title(p), "path": p, "source": "bundled"})
-        cleaned = [p for p in self.imported if is_file(p)]
+        # single pass: validate imported paths and dedup on path (bundled wins)
+        uniq: typing.Dict[str, dict] = {s["path"]: s for s in self._scan_songs_dir()}
+        cleaned = []
+        present = existing_paths(self.imported)
+        for p in self.imported:
+            if p in present:
+                cleaned.append(p)
+                if p not in uniq:
+                    uniq[p] = self._song_record(p, "imported")
         if len(cleaned) != len(self.imported):
             self.imported = cleaned
-            save_json(IMPORTED_JSON, self.imported)
-        for p in self.imported:
-            songs.append({"title": nice_title(p), "path": p, "source": "imported"})
-        seen = set(); uniq = []
-        for s in songs:
-            if s["path"] not in seen:
-                uniq.append(s); seen.add(s["path"])
-        self.master_songs = uniq
+            self._imported_set = set(cleaned)
+            self._queue_save(IMPORTED_JSON, self.imported)
+        self.master_songs = list(uniq.values())
+        self._master_dirty = False
         if hasattr(self, "player"):
-            self.player.load_playlist([s['path'] for s in self.master_songs])
+            self.player.load_playlist([s['path'] for s in self.master_songs], skip_validate=True)
 
     def _refresh_home_lists(self):
-        self.home_list.clear()
-        self.home_list.addItems([s["title"] for s in self.master_songs])
+        # resets the shared song model: only call when master_songs changed
+        self.song_model.set_songs(self.master_songs)
+        self._refresh_recents()
+
+    def _refresh_recents(self):
         self.recent_list.clear()
         for p in reversed(self.recents[-MAX_RECENTS:]):
             if is_file(p):
@@ -617,30 +1032,27 @@ class MainWindow(QtWidgets.QMainWindow):
     # Home actions & lists
     # --------------------
     def _home_menu(self, pos):
-        item = self.home_list.itemAt(pos)
-        if not item: return
+        index = self.home_list.indexAt(pos)
+        if not index.isValid(): return
         menu = QtWidgets.QMenu(self)
         add = menu.addAction("Add to Custom Playlist")
         action = menu.exec_(self.home_list.mapToGlobal(pos))
         if action == add:
-            idx = self.home_list.row(item)
-            path = self.master_songs[idx]["path"]
+            path = index.data(QtCore.Qt.UserRole)
             self._add_to_custom(path)
 
     def _home_add_to_custom(self):
-        item = self.home_list.currentItem()
-        if not item: return
-        idx = self.home_list.currentRow()
-        path = self.master_songs[idx]["path"]
+        index = self.home_list.currentIndex()
+        if not index.isValid(): return
+        path = index.data(QtCore.Qt.UserRole)
         self._add_to_custom(path)
 
     def _recent_clicked(self, item):
         path = item.data(QtCore.Qt.UserRole)
         self._play_path(path)
 
-    def _play_from_home(self, item):
-        idx = self.home_list.row(item)
-        path = self.master_songs[idx]["path"]
+    def _play_from_home(self, index):
+        path = index.data(QtCore.Qt.UserRole)
         self._play_path(path)
 
     # --------------------
@@ -649,49 +1061,54 @@ class MainWindow(QtWidgets.QMainWindow):
     def _open_device(self):
         self.pl_title.setText("My Device Songs")
         self.pl_list.clear()
+        present = existing_paths(self.imported)
         for p in self.imported:
-            if is_file(p):
+            if p in present:
                 self.pl_list.addItem(nice_title(p))
         self.stack.setCurrentIndex(1)
 
     def _open_custom(self):
         self.pl_title.setText("Custom Playlist")
         self.pl_list.clear()
+        present = existing_paths(self.custom)
         for p in self.custom:
-            if is_file(p):
+            if p in present:
                 self.pl_list.addItem(nice_title(p))
         self.stack.setCurrentIndex(1)
 
     # --------------------
     # Search
     # --------------------
-    def _on_search_change(self, text):
-        q = text.strip().lower()
-        self.search_results.clear()
+    def _do_search(self):
+        q = self.search_inp.text().strip().lower()
         if not q:
-            return
-        matches = [s for s in self.master_songs if q in s["title"].lower()]
-        if not matches:
-            self.search_results.addItem("No songs found.")
-            return
-        for s in matches:
-            it = QtWidgets.QListWidgetItem(s["title"])
-            it.setData(QtCore.Qt.UserRole, s["path"])
-            self.search_results.addItem(it)
-        if q:
-            if q in self.searches: self.searches.remove(q)
+            self.search_results.hide()
+            self.search_empty.hide()
+            return False
+        self.search_proxy.setFilterFixedString(q)
+        found = self.search_proxy.rowCount() > 0
+        self.search_results.setVisible(found)
+        self.search_empty.setVisible(not found)
+        return found
+
+    def _on_search_submit(self):
+        self._search_timer.stop()
+        if self._do_search():
+            q = self.search_inp.text().strip().lower()
+            if q in self._searches_set: self.searches.remove(q)
             self.searches.append(q)
             self.searches = self.searches[-MAX_RECENT_SEARCHES:]
-            save_json(SEARCHES_JSON, self.searches)
+            self._searches_set = set(self.searches)
+            self._queue_save(SEARCHES_JSON, self.searches)
             self._refresh_recent_searches()
 
     def _search_recent_clicked(self, item):
         self.search_inp.setText(item.text())
 
     def _search_menu(self, pos):
-        item = self.search_results.itemAt(pos)
-        if not item: return
-        path = item.data(QtCore.Qt.UserRole)
+        index = self.search_results.indexAt(pos)
+        if not index.isValid(): return
+        path = index.data(QtCore.Qt.UserRole)
         if not path: return
         menu = QtWidgets.QMenu(self)
         add = menu.addAction("Add to Custom Playlist")
@@ -699,8 +1116,8 @@ class MainWindow(QtWidgets.QMainWindow):
         if action == add:
             self._add_to_custom(path)
 
-    def _play_from_search(self, item):
-        path = item.data(QtCore.Qt.UserRole)
+    def _play_from_search(self, index):
+        path = index.data(QtCore.Qt.UserRole)
         if path:
             self._play_path(path)
 
@@ -729,13 +1146,14 @@ class MainWindow(QtWidgets.QMainWindow):
         if not files: return
         added = 0
         for f in files:
-            if f not in self.imported:
+            if f not in self._imported_set:
                 self.imported.append(f)
+                self._imported_set.add(f)
                 added += 1
         if added:
-            save_json(IMPORTED_JSON, self.imported)
-            self._refresh_master()
-            self._refresh_home_lists()
+            self._queue_save(IMPORTED_JSON, self.imported)
+            self._master_dirty = True
+            self._refresh_library()
             QtWidgets.QMessageBox.information(self, "Imported", f"Added {added} song(s).")
         else:
             QtWidgets.QMessageBox.information(self, "No new songs", "No new songs were added.")
@@ -746,22 +1164,27 @@ class MainWindow(QtWidgets.QMainWindow):
     def _play_path(self, path: str):
         if not is_file(path):
             QtWidgets.QMessageBox.warning(self, "Missing file", "This song file was not found.")
-            if path in self.imported:
-                self.imported.remove(path); save_json(IMPORTED_JSON, self.imported)
-            if path in self.custom:
-                self.custom.remove(path); save_json(CUSTOM_JSON, self.custom)
-            self._refresh_master(); self._refresh_home_lists()
+            if path in self._imported_set:
+                self.imported.remove(path); self._imported_set.discard(path)
+                self._queue_save(IMPORTED_JSON, self.imported)
+            forget_duration(path)
+            if path in self._custom_set:
+                self.custom.remove(path); self._custom_set.discard(path)
+                self._queue_save(CUSTOM_JSON, self.custom)
+            self._master_dirty = True
+            self._refresh_library()
             return
 
-        if path in self.recents: self.recents.remove(path)
+        if path in self._recents_set: self.recents.remove(path)
         self.recents.append(path)
         self.recents = self.recents[-MAX_RECENTS:]
-        save_json(RECENT_JSON, self.recents)
-        self._refresh_home_lists()
+        self._recents_set = set(self.recents)
+        self._queue_save(RECENT_JSON, self.recents)
+        self._refresh_recents()
 
-        if path not in self.player.playlist:
+        if not self.player.has_track(path):
             newlist = [path] + [s["path"] for s in self.master_songs if s["path"] != path]
-            self.player.load_playlist(newlist)
+            self.player.load_playlist(newlist, skip_validate=True)
             self.player.play_index(0)
         else:
             self.player.play_path(path)
@@ -771,11 +1194,12 @@ class MainWindow(QtWidgets.QMainWindow):
         if not is_file(path):
             QtWidgets.QMessageBox.warning(self, "Missing file", "This song file was not found.")
             return
-        if path in self.custom:
+        if path in self._custom_set:
             QtWidgets.QMessageBox.information(self, "Info", "Already in Custom Playlist.")
             return
         self.custom.append(path)
-        save_json(CUSTOM_JSON, self.custom)
+        self._custom_set.add(path)
+        self._queue_save(CUSTOM_JSON, self.custom)
         QtWidgets.QMessageBox.information(self, "Added", f"Added “{nice_title(path)}” to Custom Playlist.")
 
     # --------------------
@@ -784,59 +1208,118 @@ class MainWindow(QtWidgets.QMainWindow):
     def _on_track_changed(self, path):
         if is_file(path):
             self.mini_label.setText(nice_title(path))
-            total = get_duration(path)
-            self.label_total.setText(self._format_time(total))
-            self.timeline_slider.setValue(0)
-            # album art
-            pix = extract_album_art_pixmap(path)
-            if pix:
-                self.art_thumb.setPixmap(pix.scaled(56,56, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation))
-            else:
-                # placeholder color if no image exists
-                if os.path.exists(PLACEHOLDER_ART):
-                    p = QtGui.QPixmap(PLACEHOLDER_ART)
-                    self.art_thumb.setPixmap(p.scaled(56,56, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation))
-                else:
-                    self.art_thumb.setStyleSheet("background:#e8e0f8; border-radius:6px;")
+            # placeholder until durationChanged reports the real length
+            self._set_total_label(self._format_time(get_duration(path)))
+            self._set_timeline_pos(0)
+            # album art: memory cache hit is immediate, otherwise decode off the GUI thread.
+            # The full-player size is prepared too so opening it does not decode.
+            self._art_req_id += 1
+            self._current_art_path = path
+            self._current_art_pix = {}
+            dpr = self.devicePixelRatioF()
+            pending: typing.Dict[int, typing.Tuple[str, int]] = {}
+            for size in (56, 320):
+                px = art_pixels(size, dpr)
+                key = thumb_key(path, px)
+                pix = cached_thumb_pixmap(key) if key else None
+                if pix:
+                    self._apply_art(size, pix)
+                elif key and key not in _NO_ART_KEYS:
+                    pending[size] = (key, px)
+                elif size == 56:
+                    self._set_art_placeholder()
+            if pending:
+                # one worker decodes the art once for every missing size
+                loader = ArtLoader(self._art_req_id, path, pending)
+                loader.signals.loaded.connect(self._on_art_loaded)
+                QtCore.QThreadPool.globalInstance().start(loader)
+
+    def _on_art_loaded(self, req_id, key, size, img):
+        if req_id != self._art_req_id:
+            return
+        if img.isNull():
+            if size == 56:
+                self._set_art_placeholder()
+            return
+        pix = QtGui.QPixmap.fromImage(img)
+        pix.setDevicePixelRatio(self.devicePixelRatioF())
+        QtGui.QPixmapCache.insert(key, pix)
+        self._apply_art(size, pix)
+
+    def _apply_art(self, size, pix):
+        self._current_art_pix[size] = pix
+        if size == 56:
+            self.art_thumb.setPixmap(pix)
+
+    def _set_art_placeholder(self):
+        # placeholder color if no image exists
+        if os.path.exists(PLACEHOLDER_ART):
+            p = QtGui.QPixmap(PLACEHOLDER_ART)
+            self.art_thumb.setPixmap(p.scaled(56,56, QtCore.Qt.KeepAspectRatio, QtCore.Qt.FastTransformation))
+        else:
+            self.art_thumb.setProperty("placeholder", True)
+            self.art_thumb.style().unpolish(self.art_thumb)
+            self.art_thumb.style().polish(self.art_thumb)
 
     def _on_state_changed(self):
         self.btn_play.setText("⏸" if self.player.playing else "▶️")
 
     def _on_position_update(self, cur, total):
         if not self._seeking:
+            self._set_timeline_pos(int((cur / total) * 1000) if total > 0 else 0)
+            self._set_elapsed_label(self._format_time(cur))
             if total > 0:
-                pos = int((cur / total) * 1000)
-                self.timeline_slider.setValue(pos)
-            else:
-                self.timeline_slider.setValue(0)
-            self.label_elapsed.setText(self._format_time(cur))
-            if total > 0:
-                self.label_total.setText(self._format_time(total))
+                self._set_total_label(self._format_time(total))
+
+    def _set_timeline_pos(self, pos):
+        if pos != self._last_slider_pos:
+            self._last_slider_pos = pos
+            self.timeline_slider.setValue(pos)
+
+    def _set_elapsed_label(self, text):
+        if text != self._last_elapsed_str:
+            self._last_elapsed_str = text
+            self.label_elapsed.setText(text)
+
+    def _set_total_label(self, text):
+        if text != self._last_total_str:
+            self._last_total_str = text
+            self.label_total.setText(text)
 
     # --------------------
     # Timeline interaction
     # --------------------
     def _timeline_pressed(self):
         self._seeking = True
-
-    def _timeline_moved(self, value):
-        try:
+        total = self.player.duration()
+        if total <= 0:
             path = self.player.current_track()
             total = get_duration(path) if path else 0.0
-            sec = (value / 1000.0) * total if total > 0 else 0.0
-            self.label_elapsed.setText(self._format_time(sec))
-            self._seek_target = sec
-        except Exception:
-            pass
+        self._seek_total = total
+
+    def _timeline_moved(self, value):
+        self._seek_target_value = value
+        self._seek_timer.start()
+
+    def _apply_pending_seek_label(self):
+        total = self._seek_total
+        sec = (self._seek_target_value / 1000.0) * total if total > 0 else 0.0
+        self._set_elapsed_label(self._format_time(sec))
+        self._seek_target = sec
 
     def _timeline_released(self):
         self._seeking = False
+        # the drag moved the slider behind _set_timeline_pos's back
+        self._last_slider_pos = self.timeline_slider.value()
+        if self._seek_timer.isActive():
+            self._seek_timer.stop()
+            self._apply_pending_seek_label()
         try:
-            path = self.player.current_track()
-            if path and is_file(path):
-                total = get_duration(path)
+            # player.seek() checks the file itself
+            if self.player.current_track():
+                total = self._seek_total
                 seconds = self._seek_target if self._seek_target > 0 else 0.0
-                seconds = max(0.0, min(seconds, total))
+                seconds = max(0.0, min(seconds, total)) if total > 0 else seconds
                 self.player.seek(seconds)
         except Exception:
             pass
@@ -845,8 +1328,11 @@ class MainWindow(QtWidgets.QMainWindow):
     # Volume
     # --------------------
     def _vol_changed(self, val):
-        vol = val / 100.0
-        self.player.set_volume(vol)
+        self._pending_vol = val / 100.0
+        self._vol_timer.start()
+
+    def _commit_vol(self):
+        self.player.set_volume(self._pending_vol)
 
     def _mute_unmute(self):
         if self.player.volume > 0:
@@ -858,6 +1344,23 @@ class MainWindow(QtWidgets.QMainWindow):
             self.vol_slider.setValue(int(vol*100))
             self.player.set_volume(vol)
 
+    # --------------------
+    # Persistence
+    # --------------------
+    def _queue_save(self, path, data):
+        self._dirty_files[path] = data
+        self._flush_timer.start()
+
+    def _flush_json(self):
+        self._flush_timer.stop()
+        dirty, self._dirty_files = self._dirty_files, {}
+        for path, data in dirty.items():
+            save_json(path, data)
+
+    def closeEvent(self, event):
+        self._flush_json()
+        super().closeEvent(event)
+
     # --------------------
     # Misc
     # --------------------
@@ -865,30 +1368,48 @@ class MainWindow(QtWidgets.QMainWindow):
         self.mini_label.setText(nice_title(path))
 
     def _open_full_player(self, event):
-        cur = self.player.current_track()
-        path = cur if cur and is_file(cur) else (self.recents[-1] if self.recents else None)
-        if not path or not is_file(path):
+        path = self.player.current_track()
+        exists = is_file(path) if path else False
+        if not exists and self.recents:
+            path = self.recents[-1]
+            exists = is_file(path)
+        if not exists:
             QtWidgets.QMessageBox.information(self, "No track", "Nothing to show.")
             return
+        if self._full_player_dlg is None:
+            self._full_player_dlg = self._build_full_player_dlg()
+        pix = self._current_art_pix.get(320) if path == self._current_art_path else None
+        if pix is None:
+            pix = load_art_cached(path, 320, self.devicePixelRatioF())
+        art = self._full_art_label
+        art.setText("")
+        art.setProperty("placeholder", False)
+        if pix:
+            art.setPixmap(pix)
+        elif os.path.exists(PLACEHOLDER_ART):
+            p = QtGui.QPixmap(PLACEHOLDER_ART)
+            art.setPixmap(p.scaled(320,320, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation))
+        else:
+            art.clear()
+            art.setProperty("placeholder", True)
+            art.setText("Album Art")
+        art.style().unpolish(art)
+        art.style().polish(art)
+        self._full_title_label.setText(f"<b>{nice_title(path)}</b>")
+        self._full_player_dlg.exec_()
+
+    def _build_full_player_dlg(self):
+        # built once on first open; _open_full_player only refreshes art and title
         dlg = QtWidgets.QDialog(self)
         dlg.setWindowTitle("Now Playing")
         dlg.resize(520, 520)
         v = QtWidgets.QVBoxLayout(dlg)
-        pix = extract_album_art_pixmap(path)
         art = QtWidgets.QLabel()
+        art.setObjectName("FullArt")
         art.setFixedSize(320,320)
-        if pix:
-            art.setPixmap(pix.scaled(320,320, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation))
-        else:
-            if os.path.exists(PLACEHOLDER_ART):
-                p = QtGui.QPixmap(PLACEHOLDER_ART)
-                art.setPixmap(p.scaled(320,320, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation))
-            else:
-                art.setStyleSheet("background:#e8e0f8;")
-                art.setText("Album Art")
-                art.setAlignment(QtCore.Qt.AlignCenter)
+        art.setAlignment(QtCore.Qt.AlignCenter)
         v.addWidget(art, alignment=QtCore.Qt.AlignHCenter)
-        t = QtWidgets.QLabel(f"<b>{nice_title(path)}</b>")
+        t = QtWidgets.QLabel()
         t.setAlignment(QtCore.Qt.AlignCenter)
         v.addWidget(t)
         row = QtWidgets.QHBoxLayout()
@@ -897,29 +1418,35 @@ class MainWindow(QtWidgets.QMainWindow):
         for b in (bprev,bplay,bnext): b.setMinimumWidth(54)
         row.addStretch(); row.addWidget(bprev); row.addWidget(bplay); row.addWidget(bnext); row.addStretch()
         v.addLayout(row)
-        dlg.exec_()
+        self._full_art_label = art
+        self._full_title_label = t
+        return dlg
 
     def _format_time(self, seconds: float):
-        try:
-            s = int(seconds)
-            m = s // 60
-            s = s % 60
-            return f"{m}:{s:02d}"
-        except Exception:
+        # also rejects NaN/inf (comparisons with NaN are False)
+        if not 0 <= seconds < 1e12:
             return "0:00"
+        s = int(seconds)
+        return f"{s // 60}:{_SS[s % 60]}"
 
     # --------------------
     # QSS style
     # --------------------
-    def _qss(self):
-        return """
+    _QSS: typing.ClassVar[str] = """
         QWidget { font-family: 'Segoe UI', Roboto, Arial; color: #2b2b2b; background: #ffffff; }
         QMainWindow { background: #ffffff; }
-        QLabel#Title { font-size: 20px; font-weight:800; color:#2a014b; }
+        QLabel#Title { font-size: 20px; font-weight:800; margin-left:8px; color:#2a014b; }
+        QLabel#SectionLabel { color:#5b2b88; font-weight:700; margin-top:6px; }
+        QLabel#CardSubtitle { color:#666; }
+        QFrame#Card { background: #fff; border-radius:10px; padding:10px; border:1px solid #eee; }
+        QLabel#MiniTitle { font-weight:700; color:#2a014b; }
+        QLabel#ArtThumb { border-radius:6px; background:#eee; }
+        QLabel#ArtThumb[placeholder="true"] { background:#e8e0f8; }
+        QLabel#FullArt[placeholder="true"] { background:#e8e0f8; }
         QPushButton { background:#5b2b88; color:#fff; border-radius:8px; padding:6px 10px; font-weight:700; }
         QPushButton:hover { background:#6f3aa3; }
         QPushButton.flat { background:transparent; color:#2a014b; border:none; padding:6px 8px; }
-        QListWidget { background:#fff; border-radius:8px; padding:6px; color:#222; border:1px solid #eee; }
+        QListView { background:#fff; border-radius:8px; padding:6px; color:#222; border:1px solid #eee; }
         QLineEdit { background:#fafafa; border-radius:10px; padding:8px; color:#222; border:1px solid #eee; }
         QWidget#Mini { background:#faf7ff; border-top:1px solid #efe8ff; }
         QWidget#Nav { background:#fff; border-top:1px solid #f0edf8; }
@@ -927,21 +1454,48 @@ class MainWindow(QtWidgets.QMainWindow):
         QSlider::handle:horizontal { width:12px; background:#5b2b88; border-radius:6px; margin:-4px 0; }
         """
 
+    def _qss(self):
+        return MainWindow._QSS
+
 # --------------------
 # App entry (safe splash)
 # --------------------
-def main():
-    # attributes BEFORE creating QApplication
-    QtCore.QCoreApplication.setAttribute(QtCore.Qt.AA_EnableHighDpiScaling, True)
-    QtCore.QCoreApplication.setAttribute(QtCore.Qt.AA_UseHighDpiPixmaps, True)
+class _Task(QtCore.QRunnable):
+    # runs a plain callable on QThreadPool
+    def __init__(self, fn):
+        super().__init__()
+        self.fn = fn
 
-    app = QtWidgets.QApplication(sys.argv)
-    ensure_dirs()
+    def run(self):
+        try:
+            self.fn()
+        except Exception as e:
+            print("Background task error:", e)
 
+def splash_pixmap() -> typing.Optional[QtGui.QPixmap]:
+    """
+    Splash image: the shipped SPLASH_BAKED if present, else logo + title
+    rendered once and cached as SPLASH_CACHE (named after SPLASH_RENDER),
+    re-rendered when the logo file is newer than the cache. None when there
+    is no logo (main() then shows a plain white splash).
+    """
+    if os.path.exists(SPLASH_BAKED):
+        baked = QtGui.QPixmap(SPLASH_BAKED)
+        if not baked.isNull():
+            return baked
     # splash pixmap (use logo if available, else fallback)
-    if os.path.exists(LOGO_PATH):
-        pix = QtGui.QPixmap(LOGO_PATH).scaled(300, 300, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
-        splash_pix = QtGui.QPixmap(480, 320)
+    if LOGO_EXISTS:
+        try:
+            fresh = os.path.getmtime(SPLASH_CACHE) >= os.path.getmtime(LOGO_PATH)
+        except OSError:
+            fresh = False
+        if fresh:
+            cached = QtGui.QPixmap(SPLASH_CACHE)
+            if not cached.isNull():
+                return cached
+        title, width, height, font_family, font_size, _version = SPLASH_RENDER
+        pix = logo_pixmap(300)
+        splash_pix = QtGui.QPixmap(width, height)
         splash_pix.fill(QtGui.QColor("#ffffff"))
         painter = QtGui.QPainter(splash_pix)
         # draw background accent
@@ -955,27 +1509,58 @@ def main():
         # draw title
         pen = QtGui.QPen(QtGui.QColor("#2a014b"))
         painter.setPen(pen)
-        font = QtGui.QFont("Segoe UI", 18, QtGui.QFont.Bold)
+        font = QtGui.QFont(font_family, font_size, QtGui.QFont.Bold)
         painter.setFont(font)
-        painter.drawText(splash_pix.rect().adjusted(0, 200, 0, -20), QtCore.Qt.AlignHCenter, APP_TITLE)
+        painter.drawText(splash_pix.rect().adjusted(0, 200, 0, -20), QtCore.Qt.AlignHCenter, title)
         painter.end()
-    else:
-        splash_pix = QtGui.QPixmap(480, 320)
+        splash_pix.save(SPLASH_CACHE, "PNG")
+        return splash_pix
+    return None
+
+def main():
+    # attributes BEFORE creating QApplication
+    QtCore.QCoreApplication.setAttribute(QtCore.Qt.AA_EnableHighDpiScaling, True)
+    QtCore.QCoreApplication.setAttribute(QtCore.Qt.AA_UseHighDpiPixmaps, True)
+
+    app = QtWidgets.QApplication(sys.argv)
+    # create data/songs dirs off the GUI thread; joined before the window is built
+    pool = QtCore.QThreadPool.globalInstance()
+    pool.start(_Task(ensure_dirs))
+
+    splash_pix = splash_pixmap()
+    plain_splash = splash_pix is None
+    if plain_splash:
+        # no-logo fallback: a 1x1 pixmap, the stylesheet fills a 480x320 window
+        splash_pix = QtGui.QPixmap(1, 1)
         splash_pix.fill(QtGui.QColor("#ffffff"))
 
     splash = QtWidgets.QSplashScreen(splash_pix)
     splash.setWindowFlag(QtCore.Qt.WindowStaysOnTopHint)
+    if plain_splash:
+        splash.setStyleSheet("background:#ffffff;")
+        splash.resize(480, 320)
+        rect = splash.frameGeometry()
+        rect.moveCenter(app.primaryScreen().availableGeometry().center())
+        splash.move(rect.topLeft())
     splash.show()
     app.processEvents()
 
-    # create main window
-    window = MainWindow()
+    # build the main window on the first event-loop tick, after the splash has painted
+    window = None
+
+    def _build_window():
+        nonlocal window
+        pool.waitForDone(700)
+        window = MainWindow()
 
     # delay slightly to ensure splash painted, then show main and finish splash
     def finish_and_show():
+        if window is None:
+            _build_window()
         window.show()
         splash.finish(window)
 
+    QtCore.QTimer.singleShot(0, _build_window)
     QtCore.QTimer.singleShot(700, finish_and_show)
 
     sys.exit(app.exec_())